@@ -0,0 +1,23 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/a2a3/platform/sim/aicore/kernel.cpp" "CMakeFiles/aicore_kernel.dir/kernel.cpp.o" "gcc" "CMakeFiles/aicore_kernel.dir/kernel.cpp.o.d"
+  "/root/package/src/a2a3/platform/src/host/host_log.cpp" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/host_log.cpp.o" "gcc" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/host_log.cpp.o.d"
+  "/root/package/src/a2a3/platform/src/host/unified_log_host.cpp" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/unified_log_host.cpp.o" "gcc" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/unified_log_host.cpp.o.d"
+  "/root/package/src/a2a3/runtime/host_build_graph/aicore/aicore_executor.cpp" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/host_build_graph/aicore/aicore_executor.cpp.o" "gcc" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/host_build_graph/aicore/aicore_executor.cpp.o.d"
+  "/root/package/src/a2a3/runtime/host_build_graph/runtime/runtime.cpp" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/host_build_graph/runtime/runtime.cpp.o" "gcc" "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/host_build_graph/runtime/runtime.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/cpu_sim_context.dir/cpu_sim_context.cpp.o"
+  "CMakeFiles/cpu_sim_context.dir/cpu_sim_context.cpp.o.d"
+  "libcpu_sim_context.pdb"
+  "libcpu_sim_context.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/cpu_sim_context.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
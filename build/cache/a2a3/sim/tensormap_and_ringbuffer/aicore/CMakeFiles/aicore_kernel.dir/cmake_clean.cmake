@@ -0,0 +1,19 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/aicore_kernel.dir/kernel.cpp.o"
+  "CMakeFiles/aicore_kernel.dir/kernel.cpp.o.d"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/host_log.cpp.o"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/host_log.cpp.o.d"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/unified_log_host.cpp.o"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/platform/src/host/unified_log_host.cpp.o.d"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/aicore/aicore_executor.cpp.o"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/aicore/aicore_executor.cpp.o.d"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o"
+  "CMakeFiles/aicore_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o.d"
+  "libaicore_kernel.pdb"
+  "libaicore_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/aicore_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,47 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/aicpu_kernel.dir/cache_ops.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/cache_ops.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/device_log.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/device_log.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/device_malloc.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/device_malloc.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/device_time.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/device_time.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/orch_so_file.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/orch_so_file.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/platform_aicpu_affinity.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/platform_aicpu_affinity.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/performance_collector_aicpu.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/performance_collector_aicpu.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/platform_regs.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/platform_regs.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/tensor_dump_aicpu.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/tensor_dump_aicpu.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/unified_log_device.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/platform/src/aicpu/unified_log_device.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/aicpu/aicpu_executor.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/aicpu/aicpu_executor.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a2a3/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp.o.d"
+  "libaicpu_kernel.pdb"
+  "libaicpu_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/aicpu_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,35 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/aicpu_kernel.dir/cache_ops.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/cache_ops.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/device_log.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/device_log.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/device_malloc.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/device_malloc.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/device_time.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/device_time.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/inner_platform_regs.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/inner_platform_regs.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/orch_so_file.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/orch_so_file.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/platform_aicpu_affinity.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/platform_aicpu_affinity.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/performance_collector_aicpu.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/performance_collector_aicpu.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/platform_regs.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/platform_regs.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/tensor_dump_aicpu.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/tensor_dump_aicpu.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/unified_log_device.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/unified_log_device.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/host_build_graph/aicpu/aicpu_executor.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/host_build_graph/aicpu/aicpu_executor.cpp.o.d"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/host_build_graph/runtime/runtime.cpp.o"
+  "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/host_build_graph/runtime/runtime.cpp.o.d"
+  "libaicpu_kernel.pdb"
+  "libaicpu_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/aicpu_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
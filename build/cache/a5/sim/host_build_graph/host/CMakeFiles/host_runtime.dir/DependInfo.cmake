@@ -0,0 +1,30 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/a5/platform/sim/host/device_runner.cpp" "CMakeFiles/host_runtime.dir/device_runner.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/device_runner.cpp.o.d"
+  "/root/package/src/a5/platform/sim/host/memory_allocator.cpp" "CMakeFiles/host_runtime.dir/memory_allocator.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/memory_allocator.cpp.o.d"
+  "/root/package/src/a5/platform/sim/host/platform_compile_info.cpp" "CMakeFiles/host_runtime.dir/platform_compile_info.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/platform_compile_info.cpp.o.d"
+  "/root/package/src/a5/platform/sim/host/pto_runtime_c_api.cpp" "CMakeFiles/host_runtime.dir/pto_runtime_c_api.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/pto_runtime_c_api.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/platform_aicpu_affinity.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/sim/aicpu/platform_aicpu_affinity.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/sim/aicpu/platform_aicpu_affinity.cpp.o.d"
+  "/root/package/src/a5/platform/src/host/host_log.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/host_log.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/host_log.cpp.o.d"
+  "/root/package/src/a5/platform/src/host/performance_collector.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/performance_collector.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/performance_collector.cpp.o.d"
+  "/root/package/src/a5/platform/src/host/tensor_dump_collector.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/tensor_dump_collector.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/tensor_dump_collector.cpp.o.d"
+  "/root/package/src/a5/platform/src/host/unified_log_host.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/unified_log_host.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/unified_log_host.cpp.o.d"
+  "/root/package/src/a5/runtime/host_build_graph/host/runtime_compile_info.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/host_build_graph/host/runtime_compile_info.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/host_build_graph/host/runtime_compile_info.cpp.o.d"
+  "/root/package/src/a5/runtime/host_build_graph/host/runtime_maker.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/host_build_graph/host/runtime_maker.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/host_build_graph/host/runtime_maker.cpp.o.d"
+  "/root/package/src/a5/runtime/host_build_graph/runtime/runtime.cpp" "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/host_build_graph/runtime/runtime.cpp.o" "gcc" "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/host_build_graph/runtime/runtime.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
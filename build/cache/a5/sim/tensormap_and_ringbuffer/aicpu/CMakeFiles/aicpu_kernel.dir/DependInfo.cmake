@@ -0,0 +1,38 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/a5/platform/sim/aicpu/cache_ops.cpp" "CMakeFiles/aicpu_kernel.dir/cache_ops.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/cache_ops.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/device_log.cpp" "CMakeFiles/aicpu_kernel.dir/device_log.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/device_log.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/device_malloc.cpp" "CMakeFiles/aicpu_kernel.dir/device_malloc.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/device_malloc.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/device_time.cpp" "CMakeFiles/aicpu_kernel.dir/device_time.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/device_time.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/inner_platform_regs.cpp" "CMakeFiles/aicpu_kernel.dir/inner_platform_regs.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/inner_platform_regs.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/orch_so_file.cpp" "CMakeFiles/aicpu_kernel.dir/orch_so_file.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/orch_so_file.cpp.o.d"
+  "/root/package/src/a5/platform/sim/aicpu/platform_aicpu_affinity.cpp" "CMakeFiles/aicpu_kernel.dir/platform_aicpu_affinity.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/platform_aicpu_affinity.cpp.o.d"
+  "/root/package/src/a5/platform/src/aicpu/performance_collector_aicpu.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/performance_collector_aicpu.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/performance_collector_aicpu.cpp.o.d"
+  "/root/package/src/a5/platform/src/aicpu/platform_regs.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/platform_regs.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/platform_regs.cpp.o.d"
+  "/root/package/src/a5/platform/src/aicpu/tensor_dump_aicpu.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/tensor_dump_aicpu.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/tensor_dump_aicpu.cpp.o.d"
+  "/root/package/src/a5/platform/src/aicpu/unified_log_device.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/unified_log_device.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/platform/src/aicpu/unified_log_device.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/aicpu/aicpu_executor.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/aicpu/aicpu_executor.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/aicpu/aicpu_executor.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/orchestration/common.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp.o.d"
+  "/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp.o" "gcc" "CMakeFiles/aicpu_kernel.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,47 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/host_runtime.dir/device_runner.cpp.o"
+  "CMakeFiles/host_runtime.dir/device_runner.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/memory_allocator.cpp.o"
+  "CMakeFiles/host_runtime.dir/memory_allocator.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/platform_compile_info.cpp.o"
+  "CMakeFiles/host_runtime.dir/platform_compile_info.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/pto_runtime_c_api.cpp.o"
+  "CMakeFiles/host_runtime.dir/pto_runtime_c_api.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/sim/aicpu/platform_aicpu_affinity.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/sim/aicpu/platform_aicpu_affinity.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/host_log.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/host_log.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/performance_collector.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/performance_collector.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/tensor_dump_collector.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/tensor_dump_collector.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/unified_log_host.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/platform/src/host/unified_log_host.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/host/runtime_compile_info.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/host/runtime_compile_info.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/host/runtime_maker.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/host/runtime_maker.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/orchestration/common.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_orchestrator.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_ring_buffer.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_runtime2.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_scheduler.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_shared_memory.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/pto_tensormap.cpp.o.d"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp.o"
+  "CMakeFiles/host_runtime.dir/root/package/src/a5/runtime/tensormap_and_ringbuffer/runtime/runtime.cpp.o.d"
+  "libhost_runtime.pdb"
+  "libhost_runtime.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/host_runtime.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
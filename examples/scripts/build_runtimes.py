@@ -31,8 +31,9 @@ from typing import Optional
 # before simpler_setup/simpler are on sys.path. Point at the source tree so
 # `from simpler_setup...` and `from simpler...` resolve.
 _project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(_project_root))
-sys.path.insert(0, str(_project_root / "python"))
+for _p in (str(_project_root), str(_project_root / "python")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 from simpler_setup.platform_info import PROJECT_ROOT, discover_runtimes, parse_platform  # noqa: E402
 from simpler_setup.runtime_builder import RuntimeBuilder  # noqa: E402
@@ -418,11 +418,13 @@ NB_MODULE(_task_interface, m) {
                 auto bin_size = static_cast<uint32_t>(binary.size());
                 auto child_count = static_cast<int32_t>(children.size());
 
+                // `children` is already a by-value copy from the type caster; move the
+                // kernel buffers out of it instead of copying each binary a second time.
                 std::vector<int32_t> func_ids(children.size());
                 std::vector<std::vector<uint8_t>> child_bufs(children.size());
                 for (size_t i = 0; i < children.size(); ++i) {
                     func_ids[i] = std::get<0>(children[i]);
-                    child_bufs[i] = std::get<1>(children[i]).buffer_;
+                    child_bufs[i] = std::move(std::get<1>(children[i]).buffer_);
                 }
 
                 auto buf = make_callable<CoreCallable, CHIP_MAX_TENSOR_ARGS, 32>(
@@ -64,7 +64,7 @@ def extract_text_section(obj_input: Union[str, Path, bytes]) -> bytes:
         raise ValueError(f"Data too small to be a valid object file: {source_name}")
 
     # Detect format by magic number
-    magic32 = struct.unpack("<I", obj_data[:4])[0]
+    magic32 = struct.unpack_from("<I", obj_data)[0]
     if magic32 == MH_MAGIC_64:
         return _extract_text_macho64(obj_data, source_name)
 
@@ -79,15 +79,14 @@ def _extract_text_elf64(elf_data: bytes, source_name: str) -> bytes:
     if len(elf_data) < 64:
         raise ValueError(f"Data too small to be a valid ELF: {source_name}")
 
-    # Extract section header table info from ELF header
-    e_shoff = struct.unpack("<Q", elf_data[40:48])[0]
-    e_shnum = struct.unpack("<H", elf_data[60:62])[0]
-    e_shstrndx = struct.unpack("<H", elf_data[62:64])[0]
+    # Extract section header table info from ELF header.
+    # unpack_from reads fields in place instead of slicing a copy per field.
+    e_shoff = struct.unpack_from("<Q", elf_data, 40)[0]
+    e_shnum, e_shstrndx = struct.unpack_from("<HH", elf_data, 60)
 
-    # Get string table section header
+    # Get string table section header (sh_offset, sh_size at +24)
     shstr_offset = e_shoff + e_shstrndx * 64
-    shstr_sh_offset = struct.unpack("<Q", elf_data[shstr_offset + 24 : shstr_offset + 32])[0]
-    shstr_sh_size = struct.unpack("<Q", elf_data[shstr_offset + 32 : shstr_offset + 40])[0]
+    shstr_sh_offset, shstr_sh_size = struct.unpack_from("<QQ", elf_data, shstr_offset + 24)
 
     # Extract string table
     strtab = elf_data[shstr_sh_offset : shstr_sh_offset + shstr_sh_size]
@@ -95,12 +94,9 @@ def _extract_text_elf64(elf_data: bytes, source_name: str) -> bytes:
     # Find .text section
     for i in range(e_shnum):
         section_offset = e_shoff + i * 64
-        sh_name = struct.unpack("<I", elf_data[section_offset : section_offset + 4])[0]
-        sh_offset = struct.unpack("<Q", elf_data[section_offset + 24 : section_offset + 32])[0]
-        sh_size = struct.unpack("<Q", elf_data[section_offset + 32 : section_offset + 40])[0]
-
-        section_name = _extract_cstring(strtab, sh_name)
-        if section_name == ".text":
+        sh_name = struct.unpack_from("<I", elf_data, section_offset)[0]
+        if _extract_cstring(strtab, sh_name) == ".text":
+            sh_offset, sh_size = struct.unpack_from("<QQ", elf_data, section_offset + 24)
             text_data = elf_data[sh_offset : sh_offset + sh_size]
             logger.debug(f"Loaded .text section from {source_name} (size: {sh_size} bytes)")
             return text_data
@@ -115,21 +111,20 @@ def _extract_text_macho64(data: bytes, source_name: str) -> bytes:
     if len(data) < 32:
         raise ValueError(f"Data too small to be a valid Mach-O: {source_name}")
 
-    ncmds = struct.unpack("<I", data[16:20])[0]
+    ncmds = struct.unpack_from("<I", data, 16)[0]
 
     # Walk load commands starting at offset 32
     offset = 32
     for _ in range(ncmds):
         if offset + 8 > len(data):
             break
-        cmd = struct.unpack("<I", data[offset : offset + 4])[0]
-        cmdsize = struct.unpack("<I", data[offset + 4 : offset + 8])[0]
+        cmd, cmdsize = struct.unpack_from("<II", data, offset)
 
         if cmd == LC_SEGMENT_64:
             # segment_command_64: cmd(4) + cmdsize(4) + segname(16) + vmaddr(8)
             #   + vmsize(8) + fileoff(8) + filesize(8) + maxprot(4) + initprot(4)
             #   + nsects(4) + flags(4) = 72 bytes header
-            nsects = struct.unpack("<I", data[offset + 64 : offset + 68])[0]
+            nsects = struct.unpack_from("<I", data, offset + 64)[0]
 
             # Sections start at offset+72, each section_64 is 80 bytes:
             # sectname(16) + segname(16) + addr(8) + size(8) + offset(4) + align(4)
@@ -139,8 +134,7 @@ def _extract_text_macho64(data: bytes, source_name: str) -> bytes:
                 sect_off = sect_base + s * 80
                 sectname = data[sect_off : sect_off + 16].split(b"\x00")[0].decode("ascii")
                 if sectname == "__text":
-                    s_size = struct.unpack("<Q", data[sect_off + 40 : sect_off + 48])[0]
-                    s_offset = struct.unpack("<I", data[sect_off + 48 : sect_off + 52])[0]
+                    s_size, s_offset = struct.unpack_from("<QI", data, sect_off + 40)
                     text_data = data[s_offset : s_offset + s_size]
                     logger.debug(f"Loaded __text section from {source_name} (size: {s_size} bytes)")
                     return text_data
@@ -129,6 +129,7 @@ def paged_attention(
     q_tile = min(num_heads_dim, 128)
 
     max_bn = int(((context_lens.max().item()) + block_size - 1) // block_size)
+    pos = torch.arange(block_size).unsqueeze(0)
 
     for q_offset in range(0, num_heads_dim, q_tile):
         q_tile_size = min(q_tile, num_heads_dim - q_offset)
@@ -150,21 +151,14 @@ def paged_attention(
             kj_all = key_cache_flat[block_indices].to(torch.float32)
             vj_all = value_cache_flat[block_indices].to(torch.float32)
 
-            sij = torch.bmm(qi, kj_all.transpose(1, 2)) * scale_value
+            sij = torch.bmm(qi, kj_all.transpose(1, 2)).mul_(scale_value)
 
-            pos = torch.arange(block_size, device=sij.device).unsqueeze(0)
-            valid_mask = pos < valid_lens.unsqueeze(1)
-            valid_mask = valid_mask.unsqueeze(1)
-            sij = sij.masked_fill(~valid_mask, float("-inf"))
+            # Inactive batches have valid_lens == 0, so invalid_mask already masks their whole row.
+            invalid_mask = (pos >= valid_lens.unsqueeze(1)).unsqueeze(1)
+            sij.masked_fill_(invalid_mask, float("-inf"))
 
-            batch_mask = active_mask.view(-1, 1, 1)
-            sij = sij.masked_fill(~batch_mask, float("-inf"))
-
-            mij = sij.max(dim=-1, keepdim=True)[0]
-            mij = mij.clamp(min=-1e30)
-            pij = torch.exp(sij - mij)
-            pij = pij.masked_fill(~valid_mask, 0.0)
-            pij = pij.masked_fill(~batch_mask, 0.0)
+            mij = sij.max(dim=-1, keepdim=True)[0].clamp_(min=-1e30)
+            pij = sij.sub_(mij).exp_().masked_fill_(invalid_mask, 0.0)
             pij = pij.to(input_dtype).to(torch.float32)
             lij = pij.sum(dim=-1, keepdim=True)
 
@@ -6,12 +6,16 @@
 # INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
 # See LICENSE in the root of the software repository for the full text of the License.
 # -----------------------------------------------------------------------------------------------------------
+import hashlib
 import importlib.util
+import json
 import logging
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from typing import Optional, Union
 
 from simpler import env_manager
@@ -45,8 +49,27 @@ class KernelCompiler:
     - HOST_GXX_15: g++-15 for simulation kernels (host execution)
     - HOST_GXX: g++ for orchestration .so (host dlopen)
     - AARCH64_GXX: aarch64 cross-compiler for device orchestration
+
+    Use get_instance() to get a cached instance per platform.
+
+    Incore binaries are cached on disk under build/cache/kernels/, keyed by
+    the compile command, compiler binary, and source contents. Entries are
+    revalidated against the header dependencies reported by the compiler.
     """
 
+    _CACHE_DIR = PROJECT_ROOT / "build" / "cache" / "kernels"
+    # Least-recently-used entries beyond this are pruned after each store.
+    _CACHE_MAX_ENTRIES = 512
+
+    _instances = {}
+
+    @classmethod
+    def get_instance(cls, platform: str = "a2a3") -> "KernelCompiler":
+        """Get or create a KernelCompiler instance for the given platform."""
+        if platform not in cls._instances:
+            cls._instances[platform] = cls(platform)
+        return cls._instances[platform]
+
     def __init__(self, platform: str = "a2a3"):
         """
         Initialize KernelCompiler.
@@ -228,6 +251,130 @@ class KernelCompiler:
         logger.info(f"[{label}] Compilation {output_path} successful: {len(binary_data)} bytes")
         return binary_data
 
+    def _incore_cache_key(self, cmd: list[str], output_path: str, source_path: str) -> Optional[str]:
+        """Hash the compile command, compiler binary identity, and source contents.
+
+        The temporary output path is masked out so identical compilations map to
+        the same key. Returns None if the compiler cannot be resolved.
+        """
+        compiler = shutil.which(cmd[0])
+        if compiler is None:
+            return None
+        st = os.stat(compiler)
+        h = hashlib.sha256()
+        h.update(f"{compiler}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+        for arg in cmd[1:]:
+            h.update(("<output>" if arg == output_path else arg).encode())
+            h.update(b"\0")
+        with open(source_path, "rb") as f:
+            h.update(f.read())
+        return h.hexdigest()
+
+    def _load_cached_incore(self, key: str) -> Optional[bytes]:
+        """Return the cached binary for key, or None if missing or any dependency changed."""
+        try:
+            meta_path = self._CACHE_DIR / f"{key}.json"
+            meta = json.loads(meta_path.read_text())
+            for dep, (mtime_ns, size) in meta["deps"].items():
+                st = os.stat(dep)
+                if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                    return None
+            binary_data = (self._CACHE_DIR / f"{key}.bin").read_bytes()
+            # Bump the metadata mtime so _prune_incore_cache() sees this entry as recently used.
+            os.utime(meta_path)
+            return binary_data
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached_incore(self, key: str, binary_data: bytes, dep_path: str, started_ns: int) -> None:
+        """Persist a cache entry. Skipped silently if the depfile is missing or the cache dir is read-only.
+
+        Also skipped if any dependency was modified at or after started_ns (ccache's
+        "file too new" rule): the compiler may have read the previous contents, so
+        recording the new mtime would pin a stale binary as valid.
+        """
+        try:
+            with open(dep_path) as f:
+                _, _, dep_list = f.read().replace("\\\n", " ").partition(": ")
+            deps = {}
+            for dep in dep_list.split():
+                st = os.stat(dep)
+                if st.st_mtime_ns >= started_ns:
+                    logger.debug(f"[Incore] Skipping kernel cache store for {key}: {dep} modified during compile")
+                    return
+                deps[os.path.abspath(dep)] = [st.st_mtime_ns, st.st_size]
+
+            self._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write the binary before the metadata: an entry only counts once its .json exists.
+            for suffix, data in ((".bin", binary_data), (".json", json.dumps({"deps": deps}).encode())):
+                fd, tmp = tempfile.mkstemp(prefix=f".{key}", dir=self._CACHE_DIR)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, self._CACHE_DIR / f"{key}{suffix}")
+        except OSError as e:
+            logger.debug(f"[Incore] Skipping kernel cache store for {key}: {e}")
+            return
+        self._prune_incore_cache()
+
+    def _prune_incore_cache(self) -> None:
+        """Evict least-recently-used entries so at most _CACHE_MAX_ENTRIES remain."""
+        entries = []
+        for meta_path in self._CACHE_DIR.glob("*.json"):
+            try:
+                entries.append((meta_path.stat().st_mtime_ns, meta_path))
+            except OSError:
+                continue
+        if len(entries) <= self._CACHE_MAX_ENTRIES:
+            return
+        entries.sort(reverse=True)
+        for _, meta_path in entries[self._CACHE_MAX_ENTRIES :]:
+            # Metadata first: without its .json an entry is already a miss.
+            for path in (meta_path, meta_path.with_suffix(".bin")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _compile_incore_cached(
+        self,
+        cmd: list[str],
+        source_path: str,
+        output_path: str,
+        label: str,
+        error_hint: str,
+        delete_output: bool,
+    ) -> bytes:
+        """Like _compile_to_bytes(), but serves repeated incore compilations from the on-disk cache.
+
+        On a miss the compiler is asked for a depfile (-MD -MF) so the entry can
+        be invalidated when any included header changes.
+        """
+        key = self._incore_cache_key(cmd, output_path, source_path)
+        if key is None:
+            return self._compile_to_bytes(cmd, output_path, label, error_hint, delete_output=delete_output)
+
+        binary_data = self._load_cached_incore(key)
+        if binary_data is not None:
+            if delete_output:
+                os.remove(output_path)
+            else:
+                with open(output_path, "wb") as f:
+                    f.write(binary_data)
+            logger.info(f"[{label}] Cache hit {source_path}: {len(binary_data)} bytes")
+            return binary_data
+
+        dep_path = output_path + ".d"
+        started_ns = time.time_ns()
+        try:
+            binary_data = self._compile_to_bytes(
+                cmd + ["-MD", "-MF", dep_path], output_path, label, error_hint, delete_output=delete_output
+            )
+            self._store_cached_incore(key, binary_data, dep_path, started_ns)
+        finally:
+            if os.path.exists(dep_path):
+                os.remove(dep_path)
+        return binary_data
+
     def _get_toolchain(self, toolchain_map: dict) -> ToolchainType:
         """Get toolchain for the current platform.
 
@@ -333,8 +480,9 @@ class KernelCompiler:
         logger.info(f"[Incore] Compiling ({core_type_name}): {source_path}")
         logger.debug(f"  Command: {' '.join(cmd)}")
 
-        return self._compile_to_bytes(
+        return self._compile_incore_cached(
             cmd,
+            source_path,
             output_path,
             "Incore",
             error_hint=f"ccec compiler not found at {self.ccec.cxx_path}",
@@ -523,8 +671,9 @@ class KernelCompiler:
         logger.info(f"[SimKernel] Compiling: {source_path}")
         logger.debug(f"  Command: {' '.join(cmd)}")
 
-        return self._compile_to_bytes(
+        return self._compile_incore_cached(
             cmd,
+            source_path,
             output_path,
             "SimKernel",
             error_hint=f"{self.gxx15.cxx_path} not found. Please install g++-15.",
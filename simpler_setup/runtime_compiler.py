@@ -172,6 +172,27 @@ class RuntimeCompiler:
         if not self._find_executable("g++"):
             raise FileNotFoundError("Host C++ compiler not found: g++. Please install g++.")
 
+    @staticmethod
+    def _install_binary(binary_path: Union[str, Path], dest: Path) -> Path:
+        """Copy a built binary into dest unless dest already holds it.
+
+        copy2 preserves mtime, so an unchanged size/mtime_ns pair means the
+        incremental make was a no-op and the multi-MB copy can be skipped.
+        Fresh copies go through a temp file + rename so a library already
+        dlopen'ed from dest is never truncated in place.
+        """
+        src_st = os.stat(binary_path)
+        try:
+            dst_st = os.stat(dest)
+            if dst_st.st_size == src_st.st_size and dst_st.st_mtime_ns == src_st.st_mtime_ns:
+                return dest
+        except FileNotFoundError:
+            pass
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+        shutil.copy2(binary_path, tmp)
+        os.replace(tmp, dest)
+        return dest
+
     @staticmethod
     def _find_executable(name: str) -> bool:
         """Check if an executable exists (either as absolute path or in PATH)."""
@@ -233,9 +254,7 @@ class RuntimeCompiler:
             if output_dir is not None:
                 od = Path(output_dir)
                 od.mkdir(parents=True, exist_ok=True)
-                dest = od / binary_name
-                shutil.copy2(binary_path, dest)
-                return dest
+                return self._install_binary(binary_path, od / binary_name)
             else:
                 with open(binary_path, "rb") as f:
                     return f.read()
@@ -400,9 +419,7 @@ class RuntimeCompiler:
             if output_dir is not None:
                 od = Path(output_dir)
                 od.mkdir(parents=True, exist_ok=True)
-                dest = od / binary_name
-                shutil.copy2(binary_path, dest)
-                return dest
+                return self._install_binary(binary_path, od / binary_name)
             else:
                 with open(binary_path, "rb") as f:
                     return f.read()
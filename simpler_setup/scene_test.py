@@ -26,6 +26,7 @@ import inspect
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -306,8 +307,21 @@ def _temporary_env(env_updates):
                 os.environ[k] = v
 
 
+def _env_int(name: str, default: int) -> int:
+    """Integer env override (launch-parameter sweeps without editing CASES); default when unset/empty."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
 def _resolve_callable_paths(cls, cls_dir):
     """Resolve relative source paths in CALLABLE against cls_dir."""
+    # Join as plain strings: one str(cls_dir) instead of a Path construction per source.
+    cls_dir = str(cls_dir)
     callable_spec = cls.CALLABLE
     if "callables" in callable_spec:
         # L3: resolve inside each ChipCallable entry
@@ -329,13 +343,13 @@ def _resolve_chip_entry_paths(entry, cls_dir):
         orch = entry["orchestration"]
         if isinstance(orch, dict) and "source" in orch and not os.path.isabs(orch["source"]):
             entry["orchestration"] = dict(orch)
-            entry["orchestration"]["source"] = str(cls_dir / orch["source"])
+            entry["orchestration"]["source"] = os.path.join(cls_dir, orch["source"])
     if "incores" in entry:
         resolved = []
         for k in entry["incores"]:
             k = dict(k)
             if "source" in k and not os.path.isabs(k["source"]):
-                k["source"] = str(cls_dir / k["source"])
+                k["source"] = os.path.join(cls_dir, k["source"])
             resolved.append(k)
         entry["incores"] = resolved
 
@@ -698,17 +712,29 @@ def _compile_chip_callable_from_spec(spec, platform, runtime, cache_key):
     incores = spec["incores"]
 
     pto_isa_root = ensure_pto_isa_root()
-    kc = KernelCompiler(platform=platform)
+    kc = KernelCompiler.get_instance(platform=platform)
     is_sim = platform.endswith("sim")
 
-    orch_binary = kc.compile_orchestration(runtime, orch["source"])
     inc_dirs = kc.get_orchestration_include_dirs(runtime)
 
+    # Orchestration and incore compilations are independent subprocesses; run them concurrently.
+    with ThreadPoolExecutor(max_workers=min(len(incores) + 1, os.cpu_count() or 1, 32)) as executor:
+        orch_future = executor.submit(kc.compile_orchestration, runtime, orch["source"])
+        incore_futures = [
+            executor.submit(
+                kc.compile_incore,
+                k["source"],
+                core_type=k["core_type"],
+                pto_isa_root=pto_isa_root,
+                extra_include_dirs=inc_dirs,
+            )
+            for k in incores
+        ]
+        orch_binary = orch_future.result()
+        incore_results = [f.result() for f in incore_futures]
+
     kernel_binaries = []
-    for k in incores:
-        incore = kc.compile_incore(
-            k["source"], core_type=k["core_type"], pto_isa_root=pto_isa_root, extra_include_dirs=inc_dirs
-        )
+    for k, incore in zip(incores, incore_results):
         if not is_sim:
             incore = extract_text_section(incore)
         kernel_binaries.append((k["func_id"], CoreCallable.build(signature=k.get("signature", []), binary=incore)))
@@ -839,8 +865,8 @@ class SceneTestCase:
         from simpler.task_interface import ChipCallConfig  # noqa: PLC0415
 
         config = ChipCallConfig()
-        config.block_dim = config_dict.get("block_dim", 1)
-        config.aicpu_thread_num = config_dict.get("aicpu_thread_num", 3)
+        config.block_dim = _env_int("SIMPLER_BLOCK_DIM", config_dict.get("block_dim", 1))
+        config.aicpu_thread_num = _env_int("SIMPLER_AICPU_THREAD_NUM", config_dict.get("aicpu_thread_num", 3))
         config.enable_profiling = enable_profiling
         config.enable_dump_tensor = enable_dump_tensor
         return config
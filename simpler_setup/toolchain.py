@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import shlex
 import subprocess
@@ -27,8 +28,12 @@ class ToolchainType(IntEnum):
     AARCH64_GXX = 3  # aarch64-target-linux-gnu-g++ (cross-compile)
 
 
+@functools.lru_cache(maxsize=None)
 def _is_gcc(cxx_path: str) -> bool:
-    """Return True if *cxx_path* is a real GCC (not clang masquerading as g++)."""
+    """Return True if *cxx_path* is a real GCC (not clang masquerading as g++).
+
+    Cached per path: every toolchain construction would otherwise spawn ``--version``.
+    """
     try:
         out = subprocess.run(
             [cxx_path, "--version"], check=False, capture_output=True, text=True, timeout=5
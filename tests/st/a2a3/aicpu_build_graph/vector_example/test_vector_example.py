@@ -67,7 +67,8 @@ class TestVectorExample(SceneTestCase):
         SIZE = 128 * 128
         a = torch.full((SIZE,), 2.0, dtype=torch.float32)
         b = torch.full((SIZE,), 3.0, dtype=torch.float32)
-        f = torch.zeros(SIZE, dtype=torch.float32)
+        # No zero-fill: the kernel chain writes every element of f.
+        f = torch.empty(SIZE, dtype=torch.float32)
 
         return TaskArgsBuilder(
             Tensor("a", a),
@@ -76,9 +77,8 @@ class TestVectorExample(SceneTestCase):
         )
 
     def compute_golden(self, args, params):
-        a = args.a
-        b = args.b
-        args.f[:] = (a + b + 1) * (a + b + 2)
+        s = args.a + args.b
+        args.f[:] = (s + 1) * (s + 2)
 
 
 if __name__ == "__main__":
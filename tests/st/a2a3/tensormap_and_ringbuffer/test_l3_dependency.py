@@ -99,7 +99,8 @@ class TestL3Dependency(SceneTestCase):
         )
 
     def compute_golden(self, args, params):
-        args.f[:] = (args.a + args.b + 1) * (args.a + args.b + 2) + (args.a + args.b)
+        s = args.a + args.b
+        args.f[:] = (s + 1) * (s + 2) + s
 
 
 if __name__ == "__main__":
@@ -112,8 +112,10 @@ class TestL3Group(SceneTestCase):
         )
 
     def compute_golden(self, args, params):
-        args.f0[:] = (args.a0 + args.b0 + 1) * (args.a0 + args.b0 + 2) + (args.a0 + args.b0)
-        args.f1[:] = (args.a1 + args.b1 + 1) * (args.a1 + args.b1 + 2) + (args.a1 + args.b1)
+        s0 = args.a0 + args.b0
+        args.f0[:] = (s0 + 1) * (s0 + 2) + s0
+        s1 = args.a1 + args.b1
+        args.f1[:] = (s1 + 1) * (s1 + 2) + s1
 
 
 if __name__ == "__main__":
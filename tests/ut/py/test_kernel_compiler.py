@@ -0,0 +1,102 @@
+# Copyright (c) PyPTO Contributors.
+# This program is free software, you can redistribute it and/or modify it under the terms and conditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# -----------------------------------------------------------------------------------------------------------
+"""Tests for the KernelCompiler on-disk incore cache."""
+
+import os
+import shutil
+
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which("g++") is None, reason="g++ not available")
+
+
+@pytest.fixture
+def compiler(tmp_path, monkeypatch):
+    from simpler_setup.kernel_compiler import KernelCompiler  # noqa: PLC0415
+
+    monkeypatch.setattr(KernelCompiler, "_CACHE_DIR", tmp_path / "cache")
+    kc = KernelCompiler(platform="a2a3sim")
+    # Plain g++ is enough to exercise the cache; g++-15 is only needed for PTO ISA headers.
+    kc.gxx15.cxx_path = "g++"
+    return kc
+
+
+@pytest.fixture
+def kernel_src(tmp_path):
+    (tmp_path / "value.h").write_text("#define VALUE 1\n")
+    src = tmp_path / "kernel.cpp"
+    src.write_text('#include "value.h"\nextern "C" int kernel() { return VALUE; }\n')
+    return src
+
+
+class TestIncoreCache:
+    def test_second_compile_is_served_from_cache(self, compiler, kernel_src, monkeypatch):
+        first = compiler.compile_incore(str(kernel_src), extra_include_dirs=[str(kernel_src.parent)])
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("compiler invoked on cache hit")
+
+        monkeypatch.setattr(compiler, "_run_subprocess", _fail)
+        second = compiler.compile_incore(str(kernel_src), extra_include_dirs=[str(kernel_src.parent)])
+        assert second == first
+
+    def test_header_change_invalidates_entry(self, compiler, kernel_src):
+        inc = [str(kernel_src.parent)]
+        first = compiler.compile_incore(str(kernel_src), extra_include_dirs=inc)
+        (kernel_src.parent / "value.h").write_text("#define VALUE 22222\n")
+        second = compiler.compile_incore(str(kernel_src), extra_include_dirs=inc)
+        assert second != first
+
+    def test_header_edited_during_compile_is_not_stored(self, compiler, kernel_src, monkeypatch):
+        run_subprocess = compiler._run_subprocess
+
+        def _edit_header_then_run(*args, **kwargs):
+            result = run_subprocess(*args, **kwargs)
+            # Saved after the compiler read the old contents.
+            (kernel_src.parent / "value.h").write_text("#define VALUE 22222\n")
+            return result
+
+        monkeypatch.setattr(compiler, "_run_subprocess", _edit_header_then_run)
+        compiler.compile_incore(str(kernel_src), extra_include_dirs=[str(kernel_src.parent)])
+        assert list(compiler._CACHE_DIR.glob("*.json")) == []
+
+    def test_core_type_is_part_of_key(self, compiler, kernel_src):
+        inc = [str(kernel_src.parent)]
+        compiler.compile_incore(str(kernel_src), core_type="aiv", extra_include_dirs=inc)
+        compiler.compile_incore(str(kernel_src), core_type="aic", extra_include_dirs=inc)
+        assert len(list(compiler._CACHE_DIR.glob("*.json"))) == 2
+
+    def test_store_prunes_least_recently_used(self, compiler, kernel_src, monkeypatch):
+        monkeypatch.setattr(compiler, "_CACHE_MAX_ENTRIES", 2)
+        inc = [str(kernel_src.parent)]
+        compiler.compile_incore(str(kernel_src), core_type="aiv", extra_include_dirs=inc)
+        (aiv_meta,) = compiler._CACHE_DIR.glob("*.json")
+        compiler.compile_incore(str(kernel_src), core_type="aic", extra_include_dirs=inc)
+        (aic_meta,) = set(compiler._CACHE_DIR.glob("*.json")) - {aiv_meta}
+        # Pin distinct old timestamps; then a hit makes the older aiv entry the most recently used one.
+        os.utime(aiv_meta, (1, 1))
+        os.utime(aic_meta, (2, 2))
+        compiler.compile_incore(str(kernel_src), core_type="aiv", extra_include_dirs=inc)
+        compiler.compile_incore(str(kernel_src), core_type="aiv", extra_include_dirs=inc + ["/nonexistent"])
+
+        metas = list(compiler._CACHE_DIR.glob("*.json"))
+        assert len(metas) == 2
+        assert aiv_meta in metas
+        assert aic_meta not in metas
+        assert len(list(compiler._CACHE_DIR.glob("*.bin"))) == 2
+
+
+class TestGetInstance:
+    def test_reuses_instance_per_platform(self, monkeypatch):
+        from simpler_setup.kernel_compiler import KernelCompiler  # noqa: PLC0415
+
+        monkeypatch.setattr(KernelCompiler, "_instances", {})
+        kc = KernelCompiler.get_instance(platform="a2a3sim")
+        assert KernelCompiler.get_instance(platform="a2a3sim") is kc
+        assert KernelCompiler.get_instance(platform="a5sim") is not kc
@@ -268,6 +268,41 @@ class TestRuntimeBuilderGetBinaries:
             builder.get_binaries("test_rt", build=True)
 
 
+class TestRuntimeCompilerInstallBinary:
+    """Test copying built binaries into the output directory."""
+
+    def test_skips_copy_when_unchanged(self, tmp_path):
+        """An unchanged binary is not rewritten into output_dir."""
+        from simpler_setup.runtime_compiler import RuntimeCompiler  # noqa: PLC0415
+
+        src = tmp_path / "libhost.so"
+        src.write_bytes(b"\x7fELF" + b"\0" * 64)
+        dest = tmp_path / "out" / "libhost.so"
+        dest.parent.mkdir()
+
+        assert RuntimeCompiler._install_binary(src, dest) == dest
+        inode = dest.stat().st_ino
+        RuntimeCompiler._install_binary(src, dest)
+        assert dest.stat().st_ino == inode
+
+    def test_replaces_when_rebuilt(self, tmp_path):
+        """A rebuilt binary replaces dest via rename instead of truncating it."""
+        from simpler_setup.runtime_compiler import RuntimeCompiler  # noqa: PLC0415
+
+        src = tmp_path / "libhost.so"
+        src.write_bytes(b"old")
+        dest = tmp_path / "out" / "libhost.so"
+        dest.parent.mkdir()
+        RuntimeCompiler._install_binary(src, dest)
+        inode = dest.stat().st_ino
+
+        src.write_bytes(b"rebuilt")
+        RuntimeCompiler._install_binary(src, dest)
+        assert dest.read_bytes() == b"rebuilt"
+        assert dest.stat().st_ino != inode
+        assert list(dest.parent.iterdir()) == [dest]
+
+
 # --- Full integration tests (real compilation) ---
 
 